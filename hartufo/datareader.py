@@ -360,6 +360,7 @@ class SofaInterauralDataReader(SofaDataReader):
 class AnthropometryDataReader(DataReader):
 
     def anthropometric_data(self, subject_id, side, select=None):
+        self.query._ensure_anthropometry_loaded()
         subject_idx = np.squeeze(np.argwhere(np.squeeze(self.query._anthropometric_ids) == subject_id))
         if subject_idx.size == 0:
             raise ValueError(f'Subject id "{subject_id}" has no anthropometric measurements')
@@ -653,7 +654,7 @@ class SonicomDataReader(SofaSphericalDataReader):
             base_dir = f'P{subject_id:04d}'
         else:
             base_dir = subject_id
-        return str(self.query.sofa_directory_path / base_dir / 'HRTF' / 'HRTF' / self.query._samplerate_str / f'{base_dir}_{self.query._hrir_variant_str}_{self.query._samplerate_str}.sofa')
+        return str(self.query.sofa_directory_path / self.query._sofa_path_template.format(base_dir))
 
 
 class MitKemarDataReader(SofaSphericalDataReader):
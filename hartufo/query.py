@@ -1,9 +1,11 @@
 from .checksums import HRIR_CHECKSUMS, ANTHROPOMETRY_CHECKSUMS, IMAGE_CHECKSUMS, MESH_CHECKSUMS
 import csv
+import glob
 from pathlib import Path
 import warnings
 import re
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from numbers import Number
 from typing import Dict, Union
 from xml.etree.ElementTree import parse
@@ -61,16 +63,122 @@ _CIPIC_ANTHROPOMETRY_NAMES = {
 }
 
 
+_ARI_ANTHROPOMETRY_NAMES = {
+    **_CIPIC_ANTHROPOMETRY_NAMES,
+    'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'] + ('a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7', 'a8', 'a9'),
+}
+
+
+_LISTEN_ANTHROPOMETRY_NAMES = {
+    'sex': _CIPIC_ANTHROPOMETRY_NAMES['sex'],
+    'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:12] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][15:],
+    'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'],
+    'pinna-angle': _CIPIC_ANTHROPOMETRY_NAMES['pinna-angle'],
+}
+
+
+_ITA_ANTHROPOMETRY_NAMES = {
+    'sex': _CIPIC_ANTHROPOMETRY_NAMES['sex'],
+    'head-torso': ('head width', 'head depth (front)', 'head depth (back)', 'mean head depth', 'pinna offset', 'head height'),
+    'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'],
+}
+
+
+_HUTUBS_ANTHROPOMETRY_NAMES = {
+    'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:9] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][11:12] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][13:14] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][15:],
+    'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'][:-1] + (_CIPIC_ANTHROPOMETRY_NAMES['pinna-size'][-1]+' (down)',) + ('cavum concha depth (back)', 'crus of helix depth'),
+    'pinna-angle': _CIPIC_ANTHROPOMETRY_NAMES['pinna-angle'],
+}
+
+
+_CHEDAR_ANTHROPOMETRY_NAMES = {
+    'head-torso': ('x1', 'x11a', 'x11b', 'x12', 'x12a', 'x12b', 'x13', 'x2', 'x2a', 'x2b', 'x3', 'x3a', 'x3b', 'x4', 'x5', 'x6', 'x7', 'x8'),
+    'pinna-size': ('d1', 'd1d2', 'd2', 'd3', 'd4', 'd5', 'd6', 'd7', 'P', 'R'),
+    'pinna-angle': ('t1', 't2'),
+}
+
+
+_3D3A_ANTHROPOMETRY_NAMES = {
+    'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:3],
+    'pinna-size': ('pinna flare distance',),
+}
+
+
+_SCUT_ANTHROPOMETRY_NAMES = {
+    'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:5] + ('bitragion frontal arc', 'bitragion back arc', 'pronasale-opisthocranion distance', 'bitragion width'),
+    'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'] + ('physiognomic pinna length', 'pinna flare distance', 'pinna posterior to tragus distance'),
+    'pinna-angle': _CIPIC_ANTHROPOMETRY_NAMES['pinna-angle'] + ('pinna deflection angle', 'cavum concha angle'),
+}
+
+
+_SONICOM_HRIR_VARIANT_STRS = {
+    'raw': 'Raw',
+    'raw-itd_removed': 'Raw_NoITD',
+    'windowed': 'Windowed',
+    'windowed-itd_removed': 'Windowed_NoITD',
+    'compensated': 'FreeFieldComp',
+    'compensated-itd_removed': 'FreeFieldComp_NoITD',
+    'minphase_compensated': 'FreeFieldCompMinPhase',
+    'minphase_compensated-itd_removed': 'FreeFieldCompMinPhase_NoITD',
+}
+
+
+_SONICOM_SAMPLERATE_STRS = {44100: '44kHz', 48000: '48kHz', 96000: '96kHz'}
+
+
 def str2float(value):
     try:
         return float(value)
     except ValueError:
         return np.nan
+
+
+def _sex_codes(sex, male, female):
+    codes = np.full(np.shape(sex), np.nan)
+    codes[sex == male] = 0
+    codes[sex == female] = 1
+    return codes
+
+
+def _concat_scale(arrays, scale):
+    concatenated = np.empty((len(arrays[0]), sum(a.shape[1] for a in arrays)))
+    start = 0
+    for a in arrays:
+        concatenated[:, start:start+a.shape[1]] = a
+        start += a.shape[1]
+    concatenated *= scale
+    return concatenated
+
+
+def _glob_names(root, pattern):
+    return (os.path.basename(p) for p in glob.iglob(os.path.join(glob.escape(str(root)), pattern)))
+
+
+# Names that fit a scan but carry no parsable id are skipped rather than failing the whole scan
+def _glob_ids(root, pattern, id_re):
+    matches = (id_re.search(name) for name in _glob_names(root, pattern))
+    return sorted({int(match.group(1)) for match in matches if match is not None})
+
+
+def _scan_ids(root, suffixes, id_re):
+    matches = (id_re.search(name) for _, _, filenames in os.walk(root) for name in filenames if name.endswith(suffixes))
+    ids = np.fromiter((int(match.group(1)) for match in matches if match is not None), dtype=np.int64)
+    return np.unique(ids).tolist()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
     
 
 class DataQuery:
 
-    allowed_keys = ('subject', 'side', 'collection')
+    allowed_keys = frozenset(('subject', 'side', 'collection'))
 
 
     def __init__(
@@ -80,6 +188,10 @@ class DataQuery:
         verify: bool,
     ):
         self.collection_id = collection_id
+        # Collection directories are treated as immutable, so id queries never need invalidating
+        self._spec_cache = {}
+        self._ids_cache = {}
+        self._glob_cache = {}
 
         if download:
             self._download()
@@ -145,7 +257,7 @@ class DataQuery:
 
 
     def validate_specification(self, spec):
-        unknown_keys = sorted([x for x in set(spec.keys()).difference(self.allowed_keys)])
+        unknown_keys = sorted(spec.keys() - self.allowed_keys)
         if unknown_keys:
             raise ValueError(f'This collection does not accept specifier{"s" if len(unknown_keys) > 1 else ""} "{", ".join([f"{k.title()}Spec" for k in unknown_keys])}"')
 
@@ -165,27 +277,40 @@ class DataQuery:
         if include_subjects is not None and len(include_subjects) == 0:
             return []
 
-        separate_ids = []
-        if 'image' in specification.keys():
-            side = specification['image'].get('side', default_side)
-            rear = specification['image']['rear']
-            exclude = specification['image'].get('exclude', exclude_subjects)
-            separate_ids.append(set(self.image_ids(side, rear, exclude)))
-        if 'anthropometry' in specification.keys():
-            side = specification['anthropometry'].get('side', default_side)
-            exclude = specification['anthropometry'].get('exclude', exclude_subjects)
-            optional_kwargs = {k: v for k, v in specification['anthropometry'].items() if k in ('select', 'partial')}
-            separate_ids.append(set(self.anthropometry_ids(side, **optional_kwargs, exclude=exclude)))
-        if 'hrir' in specification.keys():
-            side = specification['hrir'].get('side', default_side)
-            exclude = specification['hrir'].get('exclude', exclude_subjects)
-            separate_ids.append(set(self.hrir_ids(side, exclude)))
-
-        selected_ids = set.intersection(*separate_ids)
-        ids = (sorted([str_id for str_id in selected_ids if isinstance(str_id[0], str)])
-             + sorted([int_id for int_id in selected_ids if isinstance(int_id[0], int)]))
+        # Only the id-related fields of the specification determine the result, so leave out transforms & co from the key
+        cache_key = (
+            _freeze({k: {f: v for f, v in specification[k].items() if f in ('side', 'rear', 'exclude', 'select', 'partial')}
+                     for k in ('image', 'anthropometry', 'hrir') if k in specification.keys()}),
+            _freeze(exclude_subjects),
+        )
+        try:
+            ids, side = self._spec_cache[cache_key]
+        except KeyError:
+            side = default_side
+            separate_ids = []
+            if 'image' in specification.keys():
+                side = specification['image'].get('side', default_side)
+                rear = specification['image']['rear']
+                exclude = specification['image'].get('exclude', exclude_subjects)
+                separate_ids.append(set(self.image_ids(side, rear, exclude)))
+            if 'anthropometry' in specification.keys():
+                side = specification['anthropometry'].get('side', default_side)
+                exclude = specification['anthropometry'].get('exclude', exclude_subjects)
+                optional_kwargs = {k: v for k, v in specification['anthropometry'].items() if k in ('select', 'partial')}
+                separate_ids.append(set(self.anthropometry_ids(side, **optional_kwargs, exclude=exclude)))
+            if 'hrir' in specification.keys():
+                side = specification['hrir'].get('side', default_side)
+                exclude = specification['hrir'].get('exclude', exclude_subjects)
+                separate_ids.append(set(self.hrir_ids(side, exclude)))
+
+            # set.intersection iterates its receiver, so start from the smallest set
+            separate_ids.sort(key=len)
+            selected_ids = separate_ids[0].intersection(*separate_ids[1:]) if separate_ids else set()
+            ids = (sorted([str_id for str_id in selected_ids if isinstance(str_id[0], str)])
+                 + sorted([int_id for int_id in selected_ids if isinstance(int_id[0], int)]))
+            self._spec_cache[cache_key] = (ids, side)
         if include_subjects is None:
-            return ids
+            return list(ids)
         if len(ids) > 0 and isinstance(include_subjects, str):
             subj_match = _SUBJECT_RE.match(include_subjects)
             position = subj_match.group(1)
@@ -203,7 +328,8 @@ class DataQuery:
                 return np.random.choice(ids, num_ears)
             else:
                 raise ValueError(f'Unknown subject selector "{include_subjects}".')
-        return [(i, s) for i, s in ids if i in include_subjects]
+        include_set = include_subjects if isinstance(include_subjects, (set, frozenset)) else set(include_subjects)
+        return [(i, s) for i, s in ids if i in include_set]
 
 
     @staticmethod
@@ -229,9 +355,25 @@ class DataQuery:
             ids = [(i, side) for i in id_fn(side)]
         else:
             raise ValueError(f'Unknown side "{side}"')
-        if exclude is None:
-            exclude = default_exclude
-        return [(i, s) for i, s in ids if i not in exclude]
+        exclude_set = frozenset(default_exclude if exclude is None else exclude)
+        return [(i, s) for i, s in ids if i not in exclude_set]
+
+
+    def _memoized_ids(self, key, id_fn):
+        try:
+            ids = self._ids_cache[key]
+        except KeyError:
+            ids = self._ids_cache[key] = id_fn()
+        return list(ids)
+
+
+    def _cached_scan(self, scan_fn, *args):
+        key = (scan_fn.__name__, *args)
+        try:
+            return self._glob_cache[key]
+        except KeyError:
+            ids = self._glob_cache[key] = scan_fn(*args)
+            return ids
 
 
 class HrirDataQuery(DataQuery):
@@ -246,14 +388,15 @@ class HrirDataQuery(DataQuery):
         **kwargs,
     ):
         if sofa_directory_path:
-            self.allowed_keys = list(self.allowed_keys) + ['hrir']
+            self.allowed_keys = self.allowed_keys | {'hrir'}
         self.sofa_directory_path = Path(sofa_directory_path)
         self._checksum_key = checksum_key
         super().__init__(**kwargs)
 
 
     def hrir_ids(self, side, exclude=None):
-        return self._id_helper(side, self._all_hrir_ids, exclude, self._default_hrirs_exclude)
+        return self._memoized_ids(('hrir', side, _freeze(exclude)),
+            lambda: self._id_helper(side, lambda s: self._cached_scan(self._all_hrir_ids, s), exclude, self._default_hrirs_exclude))
 
 
     @abstractmethod
@@ -284,31 +427,48 @@ class AnthropometryDataQuery(DataQuery):
         **kwargs,
     ):
         if anthropometry_path:
-            self.allowed_keys = list(self.allowed_keys) + ['anthropometry']
+            self.allowed_keys = self.allowed_keys | {'anthropometry'}
         self.anthropometry_path = Path(anthropometry_path)
+        self._stack_cache = {}
+        self._mask_cache = {}
         super().__init__(**kwargs)
         if anthropometry_path:
-            self._load_anthropometry(self.anthropometry_path)
+            # Loaded on first use, so that queries without anthropometry don't pay for parsing it
+            self._anthropometric_ids = None
+            self._anthropometry = None
         else:
             self._anthropometric_ids = np.array([], dtype=int)
             self._anthropometry: Dict[str, Union[np.ndarray, Dict[str, np.ndarray]]] = {}
 
 
+    def _ensure_anthropometry_loaded(self):
+        if self._anthropometry is None:
+            self._load_anthropometry(self.anthropometry_path)
+
+
     def anthropometry_ids(self, side, select=None, partial=False, exclude=None):
-        return self._id_helper(side, lambda s: self._all_anthropometry_ids(s, select, partial), exclude, self._default_anthropometry_exclude)
+        return self._memoized_ids(('anthropometry', side, _freeze(select), partial, _freeze(exclude)),
+            lambda: self._id_helper(side, lambda s: self._all_anthropometry_ids(s, select, partial), exclude, self._default_anthropometry_exclude))
 
 
     def _all_anthropometry_ids(self, side, select, partial):
-        selected_anthropometry = self._anthropometry_values(side, select)
-        if partial:
-            allowed_id_mask = (~np.isnan(selected_anthropometry)).any(axis=1)
-        else:
-            allowed_id_mask = (~np.isnan(selected_anthropometry)).all(axis=1)
+        self._ensure_anthropometry_loaded()
+        key = (side, _freeze(select), partial)
+        allowed_id_mask = self._mask_cache.get(key)
+        if allowed_id_mask is None:
+            selected_anthropometry = self._anthropometry_values(side, select)
+            nan_count = np.isnan(selected_anthropometry).sum(axis=1)
+            if partial:
+                allowed_id_mask = nan_count < selected_anthropometry.shape[1]
+            else:
+                allowed_id_mask = nan_count == 0
+            self._mask_cache[key] = allowed_id_mask
         return self._anthropometric_ids[allowed_id_mask]
 
 
     @property
     def allowed_anthropometry_selection(self):
+        self._ensure_anthropometry_loaded()
         return tuple(self._anthropometry.keys())
 
 
@@ -338,16 +498,25 @@ class AnthropometryDataQuery(DataQuery):
 
 
     def anthropometry_names(self, select=None):
+        self._ensure_anthropometry_loaded()
         select = self._selection_validator(select)
         return [n for s in select for n in self._anthropometry_names[s]]
 
 
     def _anthropometry_values(self, side, select=None):
+        self._ensure_anthropometry_loaded()
         select = self._selection_validator(select)
         if side not in ['left', 'right', 'mirrored-left', 'mirrored-right']:
             raise ValueError(f'Unknown side selector "{side}"')
         real_side = side.split('mirrored-')[-1]
-        return np.column_stack([self._anthropometry[s][real_side] if s.startswith('pinna') else self._anthropometry[s] for s in select])
+        key = (real_side, tuple(select))
+        values = self._stack_cache.get(key)
+        if values is None:
+            values = np.column_stack([self._anthropometry[s][real_side] if s.startswith('pinna') else self._anthropometry[s] for s in select])
+            # Shared between all callers, so guard against in-place modification
+            values.flags.writeable = False
+            self._stack_cache[key] = values
+        return values
 
 
     def _check_integrity(self):
@@ -373,13 +542,14 @@ class ImageDataQuery(DataQuery):
         **kwargs,
     ):
         if image_directory_path:
-            self.allowed_keys = list(self.allowed_keys) + ['image']
+            self.allowed_keys = self.allowed_keys | {'image'}
         self.image_directory_path = Path(image_directory_path)
         super().__init__(**kwargs)
 
 
     def image_ids(self, side, rear=False, exclude=None):
-        return self._id_helper(side, lambda s: self._all_image_ids(s, rear), exclude, self._default_images_exclude)
+        return self._memoized_ids(('image', side, rear, _freeze(exclude)),
+            lambda: self._id_helper(side, lambda s: self._cached_scan(self._all_image_ids, s, rear), exclude, self._default_images_exclude))
 
 
     @abstractmethod
@@ -410,13 +580,14 @@ class MeshDataQuery(DataQuery):
         **kwargs,
     ):
         if mesh_directory_path:
-            self.allowed_keys = list(self.allowed_keys) + ['3d-model']
+            self.allowed_keys = self.allowed_keys | {'3d-model'}
         self.mesh_directory_path = Path(mesh_directory_path)
         super().__init__(**kwargs)
 
 
     def mesh_ids(self, side, exclude=None):
-        return self._id_helper(side, lambda s: self._all_mesh_ids(s), exclude, self._default_mesh_exclude)
+        return self._memoized_ids(('3d-model', side, _freeze(exclude)),
+            lambda: self._id_helper(side, lambda s: self._cached_scan(self._all_mesh_ids, s), exclude, self._default_mesh_exclude))
 
 
     @abstractmethod
@@ -438,6 +609,8 @@ class MeshDataQuery(DataQuery):
 
 class CipicDataQuery(HrirDataQuery, AnthropometryDataQuery, ImageDataQuery):
 
+    _ID_RE = re.compile(r'subject_(\d{3})')
+    _IMAGE_ID_RE = re.compile(r'(\d+)_')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/cipic/'}
     ANTHROPOMETRY_DOWNLOAD = {'archive_url': 'https://sofacoustics.org/data/database/cipic/anthropometry.zip',
                               'archive_checksum': '12e0848c3f7305b38843ea213e5e6ddb',
@@ -455,12 +628,11 @@ class CipicDataQuery(HrirDataQuery, AnthropometryDataQuery, ImageDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[1]) for x in self.sofa_directory_path.glob('subject_*.sofa')])
+        return _glob_ids(self.sofa_directory_path, 'subject_*.sofa', self._ID_RE)
     
 
     def _all_image_ids(self, side, rear):
-        all_globs = (self.image_directory_path.rglob('*'+suffix) for suffix in self._image_suffix(side, rear))
-        return sorted(set([int(x.stem.split('_')[0]) for glob in all_globs for x in glob]))
+        return _scan_ids(self.image_directory_path, self._image_suffix(side, rear), self._IMAGE_ID_RE)
 
 
     @staticmethod
@@ -478,7 +650,7 @@ class CipicDataQuery(HrirDataQuery, AnthropometryDataQuery, ImageDataQuery):
         self._anthropometry = {
             'weight': mat_anth['WeightKilograms'].reshape(-1, 1),
             'age': mat_anth['age'].reshape(-1, 1),
-            'sex': np.select([mat_anth['sex'] == 'M', mat_anth['sex'] == 'F'], [0, 1], default=np.nan).reshape(-1, 1),
+            'sex': _sex_codes(mat_anth['sex'], 'M', 'F').reshape(-1, 1),
             'head-torso': 10*mat_anth['X'],
             'pinna-size': {'left': 10*mat_anth['D'][:, :8], 'right': 10*mat_anth['D'][:, 8:]},
             'pinna-angle': {'left': np.rad2deg(mat_anth['theta'][:, :2]), 'right': np.rad2deg(mat_anth['theta'][:, 2:])},
@@ -492,6 +664,7 @@ class CipicDataQuery(HrirDataQuery, AnthropometryDataQuery, ImageDataQuery):
 
 class AriDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'_nh(\d+)')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/ari/'}
     ANTHROPOMETRY_DOWNLOAD = {'file_url': 'https://www.oeaw.ac.at/fileadmin/Institute/ISF/IMG/software/anthro.mat'}
 
@@ -502,7 +675,7 @@ class AriDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_nh')[1]) for x in self.sofa_directory_path.glob('hrtf [bc]_nh*.sofa')])
+        return _glob_ids(self.sofa_directory_path, 'hrtf [bc]_nh*.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
@@ -512,22 +685,21 @@ class AriDataQuery(HrirDataQuery, AnthropometryDataQuery):
         self._anthropometry = {
             'weight': mat_anth['WeightKilograms'].reshape(-1, 1),
             'age': mat_anth['age'].reshape(-1, 1),
-            'sex': np.select([mat_anth['sex'] == 'M', mat_anth['sex'] == 'F'], [0, 1], default=np.nan).reshape(-1, 1),
+            'sex': _sex_codes(mat_anth['sex'], 'M', 'F').reshape(-1, 1),
             'head-torso': 10*mat_anth['X'],
-            'pinna-size': {'left': 10*np.column_stack((mat_anth['D'][:, :8], mat_anth['A'][:, :9])), 'right': 10*np.column_stack((mat_anth['D'][:, 8:16], mat_anth['A'][:, 9:]))},
+            'pinna-size': {'left': _concat_scale((mat_anth['D'][:, :8], mat_anth['A'][:, :9]), 10), 'right': _concat_scale((mat_anth['D'][:, 8:16], mat_anth['A'][:, 9:]), 10)},
             'pinna-angle': {'left': np.rad2deg(mat_anth['theta'][:, :2]), 'right': np.rad2deg(mat_anth['theta'][:, 2:])},
         }
 
 
     @property
     def _anthropometry_names(self):
-        anthropometry_names = _CIPIC_ANTHROPOMETRY_NAMES
-        anthropometry_names['pinna-size'] += ('a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7', 'a8', 'a9')
-        return anthropometry_names
+        return _ARI_ANTHROPOMETRY_NAMES
 
 
 class ListenDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'IRC_(\d{4})_')
     HRIR_DOWNLOAD = {'archive_url': 'http://bili2.ircam.fr/Archives/SimpleFreeFieldHRIR/LISTEN/{}/44100/archive.zip',
                      'archive_checksum': '',
                      'path_in_archive': '.',
@@ -550,20 +722,27 @@ class ListenDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[1]) for x in (self.sofa_directory_path / self._checksum_key / '44100').glob(f'IRC_????_{self._hrir_variant_char}_44100.sofa')])
+        return _glob_ids(self.sofa_directory_path / self._checksum_key / '44100', f'IRC_????_{self._hrir_variant_char}_44100.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
         # mm & deg
-        anthropometry_ids = []
-        self._anthropometry = {'sex': [], 'head-torso': [], 'pinna-size': {'left': [], 'right': []}, 'pinna-angle': {'left': [], 'right': []}}
-        for xml_path in sorted(anthropometry_path.glob('*.xml')):
+        xml_paths = sorted(anthropometry_path.glob('*.xml'))
+        num_subjects = len(xml_paths)
+        self._anthropometric_ids = np.empty(num_subjects, dtype=int)
+        widths = {key: len(names) for key, names in _LISTEN_ANTHROPOMETRY_NAMES.items()}
+        self._anthropometry = {
+            'sex': np.empty(num_subjects),
+            'head-torso': np.empty((num_subjects, widths['head-torso'])),
+            'pinna-size': {side: np.empty((num_subjects, widths['pinna-size'])) for side in ('left', 'right')},
+            'pinna-angle': {side: np.empty((num_subjects, widths['pinna-angle'])) for side in ('left', 'right')},
+        }
+        for idx, xml_path in enumerate(xml_paths):
             root = parse(xml_path).getroot()
-            anthropometry_ids.append(1000+int(root.find('./Subject/ID').text.strip().strip('IRC')))
+            self._anthropometric_ids[idx] = 1000+int(root.find('./Subject/ID').text.strip().strip('IRC'))
             sex = root.find('./Subject/Sex').text.strip()
-            self._anthropometry['sex'].append(0 if sex == 'Male' else 1 if sex == 'Female' else np.nan)
+            self._anthropometry['sex'][idx] = 0 if sex == 'Male' else 1 if sex == 'Female' else np.nan
             head_torso = [str2float(el.text.strip()) for el in root.find('.//Head_and_Torso')]
-            self._anthropometry['head-torso'].append(head_torso)
             pinna_size = {'left': [], 'right': []}
             pinna_angle = {'left': [], 'right': []}
             for el in root.find('.//Pinna'):
@@ -573,24 +752,24 @@ class ListenDataQuery(HrirDataQuery, AnthropometryDataQuery):
                     pinna_angle[side].append(str2float(el.text.strip()))
                 else:
                     pinna_size[side].append(str2float(el.text.strip()))
+            for key, values in (('head-torso', head_torso), ('pinna-size', pinna_size['left']), ('pinna-size', pinna_size['right']),
+                                ('pinna-angle', pinna_angle['left']), ('pinna-angle', pinna_angle['right'])):
+                if len(values) != widths[key]:
+                    raise ValueError(f'Expected {widths[key]} {key} measurements in file "{xml_path}", found {len(values)}')
+            self._anthropometry['head-torso'][idx] = head_torso
             for side in ('left', 'right'):
-                self._anthropometry['pinna-size'][side].append(pinna_size[side])
-                self._anthropometry['pinna-angle'][side].append(pinna_angle[side])
-        self._anthropometric_ids = np.array(anthropometry_ids)
+                self._anthropometry['pinna-size'][side][idx] = pinna_size[side]
+                self._anthropometry['pinna-angle'][side][idx] = pinna_angle[side]
 
 
     @property
     def _anthropometry_names(self):
-        return {
-            'sex': _CIPIC_ANTHROPOMETRY_NAMES['sex'],
-            'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:12] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][15:],
-            'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'],
-            'pinna-angle': _CIPIC_ANTHROPOMETRY_NAMES['pinna-angle'],
-        }
+        return _LISTEN_ANTHROPOMETRY_NAMES
 
 
 class CrossModDataQuery(HrirDataQuery):
 
+    _ID_RE = re.compile(r'IRC_(\d{4})_')
     HRIR_DOWNLOAD = {'archive_url': 'http://bili2.ircam.fr/Archives/SimpleFreeFieldHRIR/CROSSMOD/{}/44100/archive.zip',
                      'archive_checksum': '',
                      'path_in_archive': '.',
@@ -614,11 +793,12 @@ class CrossModDataQuery(HrirDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[1]) for x in (self.sofa_directory_path / self._hrir_variant / '44100').glob(f'IRC_????_{self._hrir_variant_char}_44100.sofa')])
+        return _glob_ids(self.sofa_directory_path / self._hrir_variant / '44100', f'IRC_????_{self._hrir_variant_char}_44100.sofa', self._ID_RE)
 
 
 class BiLiDataQuery(HrirDataQuery):
 
+    _ID_RE = re.compile(r'IRC_(\d{4})_')
     HRIR_DOWNLOAD = {'archive_url': 'http://bili2.ircam.fr/Archives/SimpleFreeFieldHRIR/BILI/{}/{}/archive.zip',
                      'archive_checksum': '',
                      'path_in_archive': '.',
@@ -654,11 +834,12 @@ class BiLiDataQuery(HrirDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[1]) for x in (self.sofa_directory_path / self._hrir_variant / str(self._samplerate)).glob(f'IRC_????_{self._hrir_variant_char}_HRIR_{self._samplerate}.sofa')])
+        return _glob_ids(self.sofa_directory_path / self._hrir_variant / str(self._samplerate), f'IRC_????_{self._hrir_variant_char}_HRIR_{self._samplerate}.sofa', self._ID_RE)
 
 
 class ItaDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'MRT(\d{2})')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/aachen/'}
     ANTHROPOMETRY_DOWNLOAD = {'file_url': 'http://eecs.qmul.ac.uk/~johan/hartufo/Dimensions.xlsx'} # 'https://sofacoustics.org/data/database/aachen/Dimensions.xlsx'
 
@@ -669,7 +850,7 @@ class ItaDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('MRT')[1]) for x in self.sofa_directory_path.glob('MRT??.sofa')])
+        return _glob_ids(self.sofa_directory_path, 'MRT??.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
@@ -677,26 +858,25 @@ class ItaDataQuery(HrirDataQuery, AnthropometryDataQuery):
         self._anthropometry = {'sex': [], 'head-torso': [], 'pinna-size': {'left': [], 'right': []}}
         xlsx_file = load_workbook(anthropometry_path, read_only=True)
         worksheet = xlsx_file['Tabelle1']
-        self._anthropometric_ids = np.array([row[0].value for row in worksheet['A2':'A49']])
-        sex = np.array([[cell.value for cell in row] for row in worksheet['B2':'B49']])
-        self._anthropometry['sex'] = np.select([sex == 'm', sex == 'w'], [0, 1], default=np.nan)
-        self._anthropometry['head-torso'] = [[cell.value for cell in row] for row in worksheet['C2':'H49']]
-        self._anthropometry['pinna-size']['left'] = [[cell.value for cell in row] for row in worksheet['I2':'P49']]
+        # A2:P49 in a single pass over the read-only sheet
+        rows = list(worksheet.iter_rows(min_row=2, max_row=49, max_col=16, values_only=True))
+        self._anthropometric_ids = np.fromiter((row[0] for row in rows), dtype=int, count=len(rows))
+        sex = np.array([row[1:2] for row in rows])
+        self._anthropometry['sex'] = _sex_codes(sex, 'm', 'w')
+        self._anthropometry['head-torso'] = np.array([row[2:8] for row in rows], dtype=float)
+        self._anthropometry['pinna-size']['left'] = np.array([row[8:16] for row in rows], dtype=float)
         self._anthropometry['pinna-size']['right'] = np.full_like(self._anthropometry['pinna-size']['left'], np.nan)
         xlsx_file.close()
 
 
     @property
     def _anthropometry_names(self):
-        return {
-            'sex': _CIPIC_ANTHROPOMETRY_NAMES['sex'],
-            'head-torso': ('head width', 'head depth (front)', 'head depth (back)', 'mean head depth', 'pinna offset', 'head height'),
-            'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'],
-        }
+        return _ITA_ANTHROPOMETRY_NAMES
 
 
 class HutubsDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'pp(\d+)_')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/hutubs/'}
     ANTHROPOMETRY_DOWNLOAD = {'file_url': 'https://sofacoustics.org/data/database/hutubs/AntrhopometricMeasures.csv'}
 
@@ -717,38 +897,31 @@ class HutubsDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[0].split('pp')[1]) for x in self.sofa_directory_path.glob(f'pp*_HRIRs_{self._method_str}.sofa')])
+        return _glob_ids(self.sofa_directory_path, f'pp*_HRIRs_{self._method_str}.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
         # cm & deg
-        self._anthropometry = {'head-torso': [], 'pinna-size': {'left': [], 'right': []}, 'pinna-angle': {'left': [], 'right': []}}
-        anthropometry_ids = []
-        with open(anthropometry_path, 'r') as f:
-            f.readline()
-            csv_file = csv.reader(f, quoting=csv.QUOTE_NONNUMERIC)
-            for row in csv_file:
-                if not np.isnan(row[1:]).all():
-                    anthropometry_ids.append(int(row[0]))
-                    self._anthropometry['head-torso'].append(10*np.array(row[1:14]))
-                    self._anthropometry['pinna-size']['left'].append(10*np.array(row[14:24]))
-                    self._anthropometry['pinna-angle']['left'].append(np.array(row[24:26]))
-                    self._anthropometry['pinna-size']['right'].append(10*np.array(row[26:36]))
-                    self._anthropometry['pinna-angle']['right'].append(np.array(row[36:38]))
-        self._anthropometric_ids = np.array(anthropometry_ids)
+        data = np.atleast_2d(np.genfromtxt(anthropometry_path, delimiter=',', skip_header=1))
+        measured = ~np.isnan(data[:, 1:]).all(axis=1)
+        if not measured.all():
+            data = data[measured]
+        self._anthropometric_ids = data[:, 0].astype(int)
+        self._anthropometry = {
+            'head-torso': 10*data[:, 1:14],
+            'pinna-size': {'left': 10*data[:, 14:24], 'right': 10*data[:, 26:36]},
+            'pinna-angle': {'left': data[:, 24:26], 'right': data[:, 36:38]},
+        }
 
 
     @property
     def _anthropometry_names(self):
-        return {
-            'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:9] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][11:12] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][13:14] + _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][15:],
-            'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'][:-1] + (_CIPIC_ANTHROPOMETRY_NAMES['pinna-size'][-1]+' (down)',) + ('cavum concha depth (back)', 'crus of helix depth'),
-            'pinna-angle': _CIPIC_ANTHROPOMETRY_NAMES['pinna-angle'],
-        }
+        return _HUTUBS_ANTHROPOMETRY_NAMES
 
 
 class RiecDataQuery(HrirDataQuery):
 
+    _ID_RE = re.compile(r'subject_(\d{3})')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/riec/'}
 
 
@@ -759,11 +932,12 @@ class RiecDataQuery(HrirDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[3]) for x in self.sofa_directory_path.glob('RIEC_hrir_subject_???.sofa')])
+        return _glob_ids(self.sofa_directory_path, 'RIEC_hrir_subject_???.sofa', self._ID_RE)
 
 
 class ChedarDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'chedar_(\d{4})_UV')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/chedar/'}
     ANTHROPOMETRY_DOWNLOAD = {'file_url': 'https://sofacoustics.org/data/database/chedar/measurements.mat'}
 
@@ -783,7 +957,7 @@ class ChedarDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[1]) for x in self.sofa_directory_path.glob(f'{self._radius}/chedar_????_UV{self._radius}.sofa')])
+        return _glob_ids(self.sofa_directory_path, f'{self._radius}/chedar_????_UV{self._radius}.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
@@ -800,15 +974,12 @@ class ChedarDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
     @property
     def _anthropometry_names(self):
-        return {
-            'head-torso': ('x1', 'x11a', 'x11b', 'x12', 'x12a', 'x12b', 'x13', 'x2', 'x2a', 'x2b', 'x3', 'x3a', 'x3b', 'x4', 'x5', 'x6', 'x7', 'x8'),
-            'pinna-size': ('d1', 'd1d2', 'd2', 'd3', 'd4', 'd5', 'd6', 'd7', 'P', 'R'),
-            'pinna-angle': ('t1', 't2'),
-        }
+        return _CHEDAR_ANTHROPOMETRY_NAMES
 
 
 class WidespreadDataQuery(HrirDataQuery):
 
+    _ID_RE = re.compile(r'_(\d{5})\.sofa')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/widespread/'}
 
 
@@ -838,11 +1009,12 @@ class WidespreadDataQuery(HrirDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[1]) for x in self.sofa_directory_path.glob(f'{self._grid}/{self._radius}/{self._grid}{self._radius}_?????.sofa')])
+        return _glob_ids(self.sofa_directory_path, f'{self._grid}/{self._radius}/{self._grid}{self._radius}_?????.sofa', self._ID_RE)
 
 
 class Sadie2DataQuery(HrirDataQuery, ImageDataQuery):
 
+    _ID_RE = re.compile(r'[DH](\d+)')
     HRIR_DOWNLOAD = {'archive_url': 'https://www.york.ac.uk/sadie-project/Resources/SADIEIIDatabase/Database-Master_V1-4.zip',
                      'archive_checksum': '13be7c386cbd05c5a2bcd7d9a9da3a23',
                      'path_in_archive': 'Database-Master_V1-4',}
@@ -859,20 +1031,21 @@ class Sadie2DataQuery(HrirDataQuery, ImageDataQuery):
         else:
             samplerate = 96000
             self._samplerate_str = '96K_24bit_512tap'
+        self._hrir_glob_pattern = f'[DH]*/[DH]*_HRIR_SOFA/[DH]*_{self._samplerate_str}_FIR_SOFA.sofa'
         super().__init__(collection_id='sadie2', sofa_directory_path=sofa_directory_path, image_directory_path=image_directory_path, checksum_key=f'{samplerate}', download=download, verify=verify)
         self._default_hrirs_exclude = (1, 2, 3, 4, 5, 6, 7, 8, 9) # higher spatial resolution
         self._default_images_exclude = (1, 2, 3, 16) # dummies (1, 2) & empty images (3, 16)
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[0][1:]) for x in self.sofa_directory_path.glob(f'[DH]*/[DH]*_HRIR_SOFA/[DH]*_{self._samplerate_str}_FIR_SOFA.sofa')])
+        return _glob_ids(self.sofa_directory_path, self._hrir_glob_pattern, self._ID_RE)
 
 
     def _all_image_ids(self, side, rear):
         if rear:
             raise ValueError('No rear pictures available in the SADIE II dataset')
         side_str = self._image_side_str(side)
-        return sorted([int(x.stem.split('_')[0].split()[0][1:]) for x in self.image_directory_path.glob(f'[DH]*/[DH]*_Scans/[DH]*[_ ]{side_str}.png')])
+        return _glob_ids(self.image_directory_path, f'[DH]*/[DH]*_Scans/[DH]*[_ ]{side_str}.png', self._ID_RE)
 
 
     @staticmethod
@@ -882,6 +1055,7 @@ class Sadie2DataQuery(HrirDataQuery, ImageDataQuery):
 
 class Princeton3D3ADataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'Subject(\d+)_')
     HRIR_DOWNLOAD = {'base_url': 'https://3d3a.princeton.edu/3d3a-lab-head-related-transfer-function-database'}
     ANTHROPOMETRY_DOWNLOAD = {'base_url': ''}
 
@@ -929,33 +1103,34 @@ class Princeton3D3ADataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[0].lstrip('Subject')) for x in self.sofa_directory_path.glob(f'{self._method_str}/Subject*/Subject*_{self._hrir_variant_str}.sofa')])
+        return _glob_ids(self.sofa_directory_path, f'{self._method_str}/Subject*/Subject*_{self._hrir_variant_str}.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
         # m
-        self._anthropometry = {'head-torso': [], 'pinna-size': {'left': [], 'right': []}}
-        anthropometry_ids = []
-        for mat_path in sorted(anthropometry_path.glob('Subject*.mat')):
-            mat_anth = io.loadmat(mat_path, squeeze_me=True)
-            anthropometry_ids.append(int(mat_anth['subjectID'].split('Subject')[-1]))
-            head_torso = 1000*np.array([mat_anth['headWidth'], mat_anth['headHeight'], mat_anth['headDepth']])
-            self._anthropometry['head-torso'].append(head_torso)
-            self._anthropometry['pinna-size']['left'].append(1000*np.array([mat_anth['pinnaFlareL']]))
-            self._anthropometry['pinna-size']['right'].append(1000*np.array([mat_anth['pinnaFlareR']]))
-        self._anthropometric_ids = np.array(anthropometry_ids)
+        mat_paths = sorted(anthropometry_path.glob('Subject*.mat'))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            mat_anths = list(executor.map(lambda p: io.loadmat(p, squeeze_me=True), mat_paths))
+        num_subjects = len(mat_anths)
+        self._anthropometric_ids = np.empty(num_subjects, dtype=int)
+        head_torso = np.empty((num_subjects, 3))
+        pinna_size = {'left': np.empty((num_subjects, 1)), 'right': np.empty((num_subjects, 1))}
+        for idx, mat_anth in enumerate(mat_anths):
+            self._anthropometric_ids[idx] = int(mat_anth['subjectID'].split('Subject')[-1])
+            head_torso[idx] = mat_anth['headWidth'], mat_anth['headHeight'], mat_anth['headDepth']
+            pinna_size['left'][idx] = mat_anth['pinnaFlareL']
+            pinna_size['right'][idx] = mat_anth['pinnaFlareR']
+        self._anthropometry = {'head-torso': 1000*head_torso, 'pinna-size': {'left': 1000*pinna_size['left'], 'right': 1000*pinna_size['right']}}
 
 
     @property
     def _anthropometry_names(self):
-        return {
-            'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:3],
-            'pinna-size': ('pinna flare distance',),
-        }
+        return _3D3A_ANTHROPOMETRY_NAMES
 
 
 class ScutDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
+    _ID_RE = re.compile(r'subject(\d{4})')
     HRIR_DOWNLOAD = {'base_url': 'https://sofacoustics.org/data/database/scut/'}
     ANTHROPOMETRY_DOWNLOAD = {'file_url': 'https://sofacoustics.org/data/database/scut/AnthropometricParameters.csv'}
 
@@ -965,7 +1140,7 @@ class ScutDataQuery(HrirDataQuery, AnthropometryDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([int(x.stem.split('_')[2].split('subject')[1]) for x in self.sofa_directory_path.glob('SCUT_NF_subject00??_measured.sofa')])
+        return _glob_ids(self.sofa_directory_path, 'SCUT_NF_subject00??_measured.sofa', self._ID_RE)
 
 
     def _load_anthropometry(self, anthropometry_path):
@@ -984,44 +1159,35 @@ class ScutDataQuery(HrirDataQuery, AnthropometryDataQuery):
                 self._anthropometry['pinna-size']['right'].append(row[25:36])
                 self._anthropometry['pinna-angle']['right'].append(row[36:40])
         self._anthropometric_ids = np.array(anthropometry_ids)
+        self._anthropometry['head-torso'] = np.asarray(self._anthropometry['head-torso'], dtype=float)
+        for key in ('pinna-size', 'pinna-angle'):
+            for side in ('left', 'right'):
+                self._anthropometry[key][side] = np.asarray(self._anthropometry[key][side], dtype=float)
 
 
     @property
     def _anthropometry_names(self):
-        return {
-            'head-torso': _CIPIC_ANTHROPOMETRY_NAMES['head-torso'][:5] + ('bitragion frontal arc', 'bitragion back arc', 'pronasale-opisthocranion distance', 'bitragion width'),
-            'pinna-size': _CIPIC_ANTHROPOMETRY_NAMES['pinna-size'] + ('physiognomic pinna length', 'pinna flare distance', 'pinna posterior to tragus distance'),
-            'pinna-angle': _CIPIC_ANTHROPOMETRY_NAMES['pinna-angle'] + ('pinna deflection angle', 'cavum concha angle'),
-        }
+        return _SCUT_ANTHROPOMETRY_NAMES
 
 
 class SonicomDataQuery(HrirDataQuery):
 
+    _ID_RE = re.compile(r'P\d{4}$')
     HRIR_DOWNLOAD = {'base_url': 'https://www.axdesign.co.uk/tools-and-devices/sonicom-hrtf-dataset'}
 
 
     def __init__(self, sofa_directory_path='', samplerate=96000, hrir_variant='compensated', download=False, verify=False):
-        if samplerate not in (44100, 48000, 96000):
+        if samplerate is not None and (not isinstance(samplerate, Number) or samplerate <= 0):
+            raise ValueError(f'Invalid samplerate "{samplerate}"')
+        # other samplerates are resampled from the 96 kHz recordings further down the pipeline
+        if samplerate not in _SONICOM_SAMPLERATE_STRS:
             samplerate = 96000
-        self._samplerate_str = f'{round(samplerate/1000)}kHz'
-        if hrir_variant == 'raw':
-            self._hrir_variant_str = 'Raw'
-        elif hrir_variant == 'raw-itd_removed':
-            self._hrir_variant_str = 'Raw_NoITD'
-        elif hrir_variant == 'windowed':
-            self._hrir_variant_str = 'Windowed'
-        elif hrir_variant == 'windowed-itd_removed':
-            self._hrir_variant_str = 'Windowed_NoITD'
-        elif hrir_variant == 'compensated':
-            self._hrir_variant_str = 'FreeFieldComp'
-        elif hrir_variant == 'compensated-itd_removed':
-            self._hrir_variant_str = 'FreeFieldComp_NoITD'
-        elif hrir_variant == 'minphase_compensated':
-            self._hrir_variant_str = 'FreeFieldCompMinPhase'
-        elif hrir_variant == 'minphase_compensated-itd_removed':
-            self._hrir_variant_str = 'FreeFieldCompMinPhase_NoITD'
-        else:
-            raise ValueError(f'Unknown HRIR variant "{hrir_variant}"')
+        self._samplerate_str = _SONICOM_SAMPLERATE_STRS[samplerate]
+        try:
+            self._hrir_variant_str = _SONICOM_HRIR_VARIANT_STRS[hrir_variant]
+        except KeyError:
+            raise ValueError(f'Unknown HRIR variant "{hrir_variant}"') from None
+        self._sofa_path_template = os.path.join('{0}', 'HRTF', 'HRTF', self._samplerate_str, f'{{0}}_{self._hrir_variant_str}_{self._samplerate_str}.sofa')
         try:
             super().__init__(collection_id='sonicom', sofa_directory_path=sofa_directory_path, checksum_key=f'{hrir_variant}-{samplerate}', download=download, verify=verify)
         except HTTPError as err:
@@ -1036,12 +1202,30 @@ class SonicomDataQuery(HrirDataQuery):
 
 
     def _all_hrir_ids(self, side):
+        # the same files hold both ears, so scan once for either side
+        return self._cached_scan(self._scan_hrir_ids)
+
+
+    def _scan_hrir_ids(self):
+        # the file name is fully determined by the subject directory, so list the root once and test each expected file
+        root = str(self.sofa_directory_path)
         all_ids = []
-        for x in self.sofa_directory_path.glob(f'*/HRTF/HRTF/{self._samplerate_str}/*_{self._hrir_variant_str}_{self._samplerate_str}.sofa'):
-            if x.stem.startswith('KEMAR_'):
-                all_ids.append('KEMAR_'+x.stem.split('_')[1])
+        try:
+            with os.scandir(root) as entries:
+                subject_dirs = [entry.name for entry in entries if (self._ID_RE.match(entry.name) or entry.name.startswith('KEMAR_')) and entry.is_dir()]
+        except FileNotFoundError:
+            return []
+        sofa_paths = [os.path.join(root, self._sofa_path_template.format(name)) for name in subject_dirs]
+        # each check is a stat round trip, which adds up on network file systems
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            present = list(executor.map(os.path.isfile, sofa_paths))
+        for name, is_present in zip(subject_dirs, present):
+            if not is_present:
+                continue
+            if name.startswith('KEMAR_'):
+                all_ids.append('KEMAR_'+name.split('_')[1])
             else:
-                all_ids.append(int(x.stem.split('_')[0].lstrip('P')))
+                all_ids.append(int(name[1:5]))
         return sorted([str_id for str_id in all_ids if isinstance(str_id, str)]) + sorted([int_id for int_id in all_ids if isinstance(int_id, int)])
 
 
@@ -1055,7 +1239,7 @@ class MitKemarDataQuery(HrirDataQuery):
 
 
     def _all_hrir_ids(self, side):
-        return sorted([x.stem.split('_')[2] for x in self.sofa_directory_path.glob('mit_kemar_*_pinna.sofa')])
+        return sorted([name.split('_')[2] for name in _glob_names(self.sofa_directory_path, 'mit_kemar_*_pinna.sofa')])
 
 
 class CustomDataQuery(HrirDataQuery):